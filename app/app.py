@@ -1,32 +1,68 @@
 """Main FastAPI application for Dragonseeker game."""
 
+import asyncio
+import logging
 import secrets
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
+from core.constants import CLEANUP_INTERVAL_SECONDS
 from core.game_manager import game_manager
+from core.templates import render_static_template
 from middleware import RateLimitMiddleware, SecurityHeadersMiddleware
 from routes import game, gameplay, lobby, websocket
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def cleanup_stale_games_periodically() -> None:
+    """Remove stale/finished games in the background at a fixed interval."""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        try:
+            cleaned = game_manager.cleanup_stale_games()
+        except Exception:
+            logger.exception("🧹 Failed to clean up stale games")
+            continue
+        if cleaned > 0:
+            logger.info("🧹 Cleaned up %d stale/finished games", cleaned)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    print("🐉 Dragonseeker game server starting...")
+    logger.info("🐉 Dragonseeker game server starting...")
 
     # Generate secret key for token signing (in memory, rotates on restart)
     app.state.secret_key = secrets.token_hex(32)
-    print("🔐 Generated secret key for token signing")
+    logger.info("🔐 Generated secret key for token signing")
+
+    logger.info("🔗 Game manager initialized")
+
+    # uvloop is installed with fastapi[standard] and picked automatically by uvicorn
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if loop_module.startswith("uvloop"):
+        logger.info("⚡ Running on uvloop event loop")
+    else:
+        logger.warning(
+            "🐢 Running on %s event loop; install uvloop for better throughput", loop_module
+        )
+
+    # Sweep stale games off the request path
+    cleanup_task = asyncio.create_task(cleanup_stale_games_periodically())
 
-    print("🔗 Game manager initialized")
     yield
     # Shutdown
-    print("👋 Shutting down game server...")
+    logger.info("👋 Shutting down game server...")
+    cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await cleanup_task
 
 
 # Initialize FastAPI app
@@ -35,6 +71,7 @@ app = FastAPI(
     description="A social deduction party game",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -62,9 +99,6 @@ app.add_middleware(RateLimitMiddleware)  # type: ignore[arg-type]
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Configure templates
-templates = Jinja2Templates(directory="templates")
-
 # Include routers
 app.include_router(game.router, tags=["game"])
 app.include_router(lobby.router, tags=["lobby"])
@@ -73,22 +107,26 @@ app.include_router(websocket.router, tags=["websocket"])
 
 
 @app.get("/")
-async def index(request: Request):
+async def index():
     """Landing page - create new game."""
-    return templates.TemplateResponse(request=request, name="index.html")
+    return HTMLResponse(
+        render_static_template("index.html"), headers={"Cache-Control": "public, max-age=60"}
+    )
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
-    # Cleanup stale/finished games
-    cleaned = game_manager.cleanup_stale_games()
-    if cleaned > 0:
-        print(f"🧹 Cleaned up {cleaned} stale/finished games")
-
     stats = game_manager.get_stats()
     return {
         "status": "healthy",
         "active_games": stats["active_games"],
         "total_players": stats["total_players"],
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Single worker only: game state lives in this process's memory
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
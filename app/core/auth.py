@@ -4,10 +4,41 @@ import base64
 import hashlib
 import hmac
 import time
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException, Request
 
+from .auth_cache import cache_token, get_cached_token
+
+
+@lru_cache(maxsize=8)
+def _keyed_hmac(secret_key: str) -> hmac.HMAC:
+    """Build the keyed HMAC-SHA256 state for a secret key once.
+
+    Args:
+        secret_key: Secret key for signing
+
+    Returns:
+        HMAC object with no message data, to be copied per signature
+    """
+    return hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+
+def _sign(payload: bytes, secret_key: str) -> bytes:
+    """Compute the HMAC-SHA256 signature of a token payload.
+
+    Args:
+        payload: Token payload bytes
+        secret_key: Secret key for signing
+
+    Returns:
+        Raw signature bytes
+    """
+    mac = _keyed_hmac(secret_key).copy()
+    mac.update(payload)
+    return mac.digest()
+
 
 def generate_player_token(game_id: str, player_id: str, secret_key: str) -> str:
     """Generate a signed token for player authentication.
@@ -25,11 +56,7 @@ def generate_player_token(game_id: str, player_id: str, secret_key: str) -> str:
     payload = f"{game_id}:{player_id}:{expiry}"
 
     # Generate HMAC signature
-    signature = hmac.new(
-        secret_key.encode(),
-        payload.encode(),
-        hashlib.sha256,
-    ).digest()
+    signature = _sign(payload.encode(), secret_key)
 
     # Encode signature as base64
     signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
@@ -51,16 +78,36 @@ def verify_player_token(token: str | None, secret_key: str) -> dict[str, Any] |
     if not token:
         return None
 
+    # Tokens verified before skip the HMAC check
+    cached = get_cached_token(token, secret_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Split token into payload and signature
-        parts = token.split(".")
-        if len(parts) != 2:
+        token_bytes = token.encode()
+
+        # Signature is everything after the last dot
+        dot = token_bytes.rfind(b".")
+        if dot == -1:
             return None
 
-        payload, signature_b64 = parts
+        payload_bytes = token_bytes[:dot]
+        signature_b64 = token_bytes[dot + 1 :]
+
+        # Verify signature over the raw payload bytes before parsing anything
+        expected_signature = _sign(payload_bytes, secret_key)
+
+        # Decode provided signature (add padding if needed)
+        provided_signature = base64.urlsafe_b64decode(
+            signature_b64 + b"=" * (-len(signature_b64) % 4)
+        )
+
+        # Constant-time comparison to prevent timing attacks
+        if not hmac.compare_digest(expected_signature, provided_signature):
+            return None
 
         # Parse payload
-        payload_parts = payload.split(":")
+        payload_parts = payload_bytes.decode().split(":")
         if len(payload_parts) != 3:
             return None
 
@@ -71,26 +118,13 @@ def verify_player_token(token: str | None, secret_key: str) -> dict[str, Any] |
         if time.time() > expiry:
             return None
 
-        # Verify signature
-        expected_signature = hmac.new(
-            secret_key.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).digest()
-
-        # Decode provided signature (add padding if needed)
-        padding = "=" * (4 - len(signature_b64) % 4)
-        provided_signature = base64.urlsafe_b64decode(signature_b64 + padding)
-
-        # Constant-time comparison to prevent timing attacks
-        if not hmac.compare_digest(expected_signature, provided_signature):
-            return None
-
-        return {
+        token_data = {
             "game_id": game_id,
             "player_id": player_id,
             "expiry": expiry,
         }
+        cache_token(token, secret_key, token_data)
+        return token_data
 
     except (ValueError, KeyError):
         return None
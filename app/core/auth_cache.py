@@ -0,0 +1,93 @@
+"""In-memory cache of verified player tokens.
+
+Lets repeat verifications (page loads, WebSocket reconnects) skip the
+HMAC check. Entries expire with the token itself and are dropped when
+their game is removed.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Upper bound on cached tokens (least recently used entries are evicted first)
+MAX_CACHED_TOKENS = 10_000
+
+# (token, secret_key) -> verified token data
+_token_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+# game_id -> cache keys for that game's tokens (for invalidation)
+_game_index: dict[str, set[tuple[str, str]]] = {}
+
+
+def get_cached_token(token: str, secret_key: str) -> dict[str, Any] | None:
+    """Look up previously verified token data.
+
+    Args:
+        token: The raw token string
+        secret_key: Secret key the token was verified with
+
+    Returns:
+        Cached token data if present and unexpired, None otherwise
+    """
+    key = (token, secret_key)
+    token_data = _token_cache.get(key)
+    if token_data is None:
+        return None
+
+    if time.time() > token_data["expiry"]:
+        _discard(key)
+        return None
+
+    _token_cache.move_to_end(key)
+    return token_data
+
+
+def cache_token(token: str, secret_key: str, token_data: dict[str, Any]) -> None:
+    """Store verified token data.
+
+    Args:
+        token: The raw token string
+        secret_key: Secret key the token was verified with
+        token_data: Verified data with game_id, player_id, and expiry
+    """
+    key = (token, secret_key)
+    _token_cache[key] = token_data
+    _token_cache.move_to_end(key)
+    _game_index.setdefault(token_data["game_id"], set()).add(key)
+
+    while len(_token_cache) > MAX_CACHED_TOKENS:
+        oldest_key = next(iter(_token_cache))
+        _discard(oldest_key)
+
+
+def invalidate_game_tokens(game_id: str) -> None:
+    """Drop all cached tokens for a game.
+
+    Args:
+        game_id: The game session ID
+    """
+    for key in _game_index.pop(game_id, ()):
+        _token_cache.pop(key, None)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached tokens."""
+    _token_cache.clear()
+    _game_index.clear()
+
+
+def _discard(key: tuple[str, str]) -> None:
+    """Remove a single cache entry and its game index reference.
+
+    Args:
+        key: The (token, secret_key) cache key
+    """
+    token_data = _token_cache.pop(key, None)
+    if token_data is None:
+        return
+
+    game_keys = _game_index.get(token_data["game_id"])
+    if game_keys is not None:
+        game_keys.discard(key)
+        if not game_keys:
+            del _game_index[token_data["game_id"]]
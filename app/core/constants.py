@@ -7,9 +7,11 @@ MAX_PLAYERS = 12
 # Game state cleanup
 GAME_TTL_SECONDS = 3600  # Unfinished games are cleaned up after 1 hour
 FINISHED_GAME_TTL_SECONDS = 1800  # Finished games are cleaned up after 30 minutes
+CLEANUP_INTERVAL_SECONDS = 60  # How often the background task sweeps stale games
 
 # WebSocket settings
 WEBSOCKET_PING_INTERVAL = 30  # Ping every 30 seconds
+WEBSOCKET_IDLE_TIMEOUT_SECONDS = 300  # Close connections with no messages for 5 minutes
 
 # Word pairs for the game
 # Format: (villager_word, knight_word)
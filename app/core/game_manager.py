@@ -1,10 +1,38 @@
 """Game manager singleton for coordinating multiple games."""
 
+import base64
 import secrets
-from datetime import datetime, timedelta
+import time
+from collections import deque
 
+from .auth_cache import invalidate_game_tokens
 from .constants import FINISHED_GAME_TTL_SECONDS, GAME_TTL_SECONDS
-from .game_session import GameSession, GameState
+from .game_session import GameSession
+from .player import Player
+
+# Game IDs are 6 random bytes, base64url-encoded to 8 characters
+_GAME_ID_BYTES = 6
+_GAME_IDS_PER_BATCH = 16
+
+# Pre-generated game IDs (drawn from the CSPRNG in batches)
+_game_id_buffer: deque[str] = deque()
+
+
+def _new_game_id() -> str:
+    """Get a random, URL-safe game ID.
+
+    Random bytes are read from the OS in batches to avoid a syscall per game.
+
+    Returns:
+        An 8-character URL-safe game ID
+    """
+    if not _game_id_buffer:
+        raw = secrets.token_bytes(_GAME_ID_BYTES * _GAME_IDS_PER_BATCH)
+        _game_id_buffer.extend(
+            base64.urlsafe_b64encode(raw[i : i + _GAME_ID_BYTES]).decode()
+            for i in range(0, len(raw), _GAME_ID_BYTES)
+        )
+    return _game_id_buffer.popleft()
 
 
 class GameManager:
@@ -12,7 +40,12 @@ class GameManager:
 
     def __init__(self):
         """Initialize the game manager."""
-        self.games: dict[str, GameSession] = {}
+        # Games are partitioned by whether they have finished (each has its own TTL)
+        self.active_games: dict[str, GameSession] = {}
+        self.finished_games: dict[str, GameSession] = {}
+
+        # Running player count, kept up to date by GameSession notifications
+        self._total_players = 0
 
     def create_game(self) -> GameSession:
         """Create a new game session with a unique ID.
@@ -21,14 +54,15 @@ class GameManager:
             The newly created GameSession
         """
         # Generate a unique, URL-safe game ID (8 characters)
-        game_id = secrets.token_urlsafe(6)
+        game_id = _new_game_id()
 
         # Ensure uniqueness (very unlikely to collide, but check anyway)
-        while game_id in self.games:
-            game_id = secrets.token_urlsafe(6)
+        while game_id in self.active_games or game_id in self.finished_games:
+            game_id = _new_game_id()
 
         game = GameSession(game_id=game_id)
-        self.games[game_id] = game
+        game.attach_manager(self)
+        self.active_games[game_id] = game
         return game
 
     def get_game(self, game_id: str) -> GameSession | None:
@@ -40,7 +74,28 @@ class GameManager:
         Returns:
             The GameSession if found, None otherwise
         """
-        return self.games.get(game_id)
+        game = self.active_games.get(game_id)
+        if game is None:
+            game = self.finished_games.get(game_id)
+        return game
+
+    def get_game_and_player(
+        self, game_id: str, player_id: str
+    ) -> tuple[GameSession, Player | None] | None:
+        """Retrieve a game session and one of its players in a single call.
+
+        Args:
+            game_id: The game's unique identifier
+            player_id: The player's unique ID
+
+        Returns:
+            Tuple of (game, player or None if not in the game), or None if
+            the game is not found
+        """
+        game = self.get_game(game_id)
+        if game is None:
+            return None
+        return game, game.players.get(player_id)
 
     def remove_game(self, game_id: str) -> None:
         """Remove a game session.
@@ -48,8 +103,39 @@ class GameManager:
         Args:
             game_id: The game's unique identifier
         """
-        if game_id in self.games:
-            del self.games[game_id]
+        game = self.active_games.pop(game_id, None)
+        if game is None:
+            game = self.finished_games.pop(game_id, None)
+        if game is None:
+            return
+
+        game.attach_manager(None)
+        self._total_players -= len(game.players)
+        invalidate_game_tokens(game_id)
+
+    def notify_player_count_changed(self, delta: int) -> None:
+        """Update the running player count.
+
+        Args:
+            delta: Change in number of players
+        """
+        self._total_players += delta
+
+    def notify_finished_changed(self, game_id: str, is_finished: bool) -> None:
+        """Move a game between the active and finished partitions.
+
+        Args:
+            game_id: The game's unique identifier
+            is_finished: Whether the game is now finished
+        """
+        source, target = (
+            (self.active_games, self.finished_games)
+            if is_finished
+            else (self.finished_games, self.active_games)
+        )
+        game = source.pop(game_id, None)
+        if game is not None:
+            target[game_id] = game
 
     def cleanup_stale_games(self) -> int:
         """Remove games that are too old or finished.
@@ -57,22 +143,20 @@ class GameManager:
         Returns:
             Number of games cleaned up
         """
-        now = datetime.now()
-        cutoff_time = now - timedelta(seconds=GAME_TTL_SECONDS)
-        finished_cutoff = now - timedelta(seconds=FINISHED_GAME_TTL_SECONDS)
-
-        stale_game_ids = []
-        for game_id, game in self.games.items():
-            # Remove old unfinished games (after 1 hour)
-            if game.created_at < cutoff_time:
-                stale_game_ids.append(game_id)
-            # Remove finished games (after 30 minutes)
-            elif (
-                game.state == GameState.FINISHED
-                and game.finished_at
-                and game.finished_at < finished_cutoff
-            ):
-                stale_game_ids.append(game_id)
+        now = time.monotonic()
+        cutoff_time = now - GAME_TTL_SECONDS
+        finished_cutoff = now - FINISHED_GAME_TTL_SECONDS
+
+        # Remove old unfinished games (after 1 hour)
+        stale_game_ids = [
+            game_id for game_id, game in self.active_games.items() if game.created_at < cutoff_time
+        ]
+        # Remove finished games (after 30 minutes)
+        stale_game_ids += [
+            game_id
+            for game_id, game in self.finished_games.items()
+            if game.finished_at is not None and game.finished_at < finished_cutoff
+        ]
 
         for game_id in stale_game_ids:
             self.remove_game(game_id)
@@ -85,13 +169,10 @@ class GameManager:
         Returns:
             Dictionary with game statistics
         """
-        total_players = sum(len(game.players) for game in self.games.values())
-        active_games = sum(1 for game in self.games.values() if game.state.value != "finished")
-
         return {
-            "total_games": len(self.games),
-            "active_games": active_games,
-            "total_players": total_players,
+            "total_games": len(self.active_games) + len(self.finished_games),
+            "active_games": len(self.active_games),
+            "total_players": self._total_players,
         }
 
 
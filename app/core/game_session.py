@@ -1,16 +1,29 @@
 """Game session management."""
 
-import json
+import asyncio
+import logging
 import random
-from datetime import datetime
+import time
+import weakref
 from enum import Enum
+from typing import TYPE_CHECKING
 
+import orjson
 from fastapi import WebSocket
 
 from .constants import MIN_PLAYERS, WORD_PAIRS
 from .player import Player
 from .roles import Role, assign_roles
 
+if TYPE_CHECKING:
+    from .game_manager import GameManager
+
+logger = logging.getLogger(__name__)
+
+# Serialized state_update envelope, completed with the state object and a closing brace
+_STATE_MESSAGE_PREFIX = b'{"type":"state_update","data":'
+_EMPTY_STATE_MESSAGE = _STATE_MESSAGE_PREFIX + b"{}}"
+
 
 class GameState(str, Enum):
     """Game state enum."""
@@ -33,12 +46,15 @@ class GameSession:
         """
         self.game_id: str = game_id
         self.players: dict[str, Player] = {}
-        self.state: GameState = GameState.LOBBY
+        self._nickname_keys: set[str] = set()  # Casefolded nicknames, for duplicate checks
+        self._alive_count: int = 0  # Kept in sync by Player.is_alive via notify_alive_changed
+        self._state: GameState = GameState.LOBBY
         self.villager_word: str | None = None  # Word for villagers
         self.knight_word: str | None = None  # Similar word for knights
-        self.created_at: datetime = datetime.now()
-        self.started_at: datetime | None = None
-        self.finished_at: datetime | None = None  # When game finished
+        # Timestamps are time.monotonic() seconds (only used for TTLs and timers)
+        self.created_at: float = time.monotonic()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None  # When game finished
         self.votes: dict[str, str] = {}  # voter_id -> target_id
         self.connections: dict[str, WebSocket] = {}  # player_id -> WebSocket
         self.winner: str | None = None  # "villagers" or "dragon"
@@ -49,7 +65,68 @@ class GameSession:
 
         # Voting timer settings
         self.voting_timer_seconds: int | None = None  # Timer duration (30-180), None = disabled
-        self.voting_started_at: datetime | None = None  # When voting started (for time calculation)
+        self.voting_started_at: float | None = None  # When voting started (for time calculation)
+
+        # Manager notified of player/state changes so it can keep running stats
+        self._manager_ref: weakref.ref[GameManager] | None = None
+
+    @property
+    def state(self) -> GameState:
+        """Current game state."""
+        return self._state
+
+    @state.setter
+    def state(self, value: GameState) -> None:
+        """Set the game state, notifying the manager when the game finishes or reopens.
+
+        Entering FINISHED also records finished_at.
+
+        Args:
+            value: The new game state
+        """
+        was_finished = self._state is GameState.FINISHED
+        self._state = value
+        is_finished = value is GameState.FINISHED
+        if was_finished == is_finished:
+            return
+
+        if is_finished:
+            self.finished_at = time.monotonic()
+
+        manager = self._manager_ref() if self._manager_ref else None
+        if manager:
+            manager.notify_finished_changed(self.game_id, is_finished)
+
+    def attach_manager(self, manager: "GameManager | None") -> None:
+        """Register (or clear) the manager tracking this game's stats.
+
+        Args:
+            manager: The GameManager owning this game, or None to detach
+        """
+        self._manager_ref = weakref.ref(manager) if manager else None
+
+    @property
+    def alive_count(self) -> int:
+        """Number of players still alive."""
+        return self._alive_count
+
+    def notify_alive_changed(self, delta: int) -> None:
+        """Update the alive count when a player is eliminated or revived.
+
+        Args:
+            delta: Change in number of alive players
+        """
+        self._alive_count += delta
+
+    def _notify_player_count_changed(self, delta: int) -> None:
+        """Tell the manager that players were added or removed.
+
+        Args:
+            delta: Change in number of players
+        """
+        manager = self._manager_ref() if self._manager_ref else None
+        if manager:
+            manager.notify_player_count_changed(delta)
 
     def add_player(self, nickname: str) -> Player:
         """Add a new player to the game.
@@ -63,12 +140,16 @@ class GameSession:
         Raises:
             ValueError: If game is not in lobby state
         """
-        if self.state != GameState.LOBBY:
+        if self.state is not GameState.LOBBY:
             raise ValueError("Cannot join game that has already started")
 
         is_host = len(self.players) == 0  # First player is host
         player = Player(nickname=nickname, is_host=is_host)
         self.players[player.id] = player
+        self._nickname_keys.add(nickname.casefold())
+        player.attach_session(self)
+        self._alive_count += 1
+        self._notify_player_count_changed(1)
         return player
 
     def remove_player(self, player_id: str) -> None:
@@ -78,7 +159,12 @@ class GameSession:
             player_id: ID of the player to remove
         """
         if player_id in self.players:
-            del self.players[player_id]
+            player = self.players.pop(player_id)
+            self._nickname_keys.discard(player.nickname.casefold())
+            player.attach_session(None)
+            if player.is_alive:
+                self._alive_count -= 1
+            self._notify_player_count_changed(-1)
 
         if player_id in self.connections:
             del self.connections[player_id]
@@ -88,6 +174,17 @@ class GameSession:
             next_player = next(iter(self.players.values()))
             next_player.is_host = True
 
+    def is_nickname_taken(self, nickname: str) -> bool:
+        """Check if a nickname is already used in this game (case-insensitive).
+
+        Args:
+            nickname: The nickname to check
+
+        Returns:
+            True if another player already has this nickname
+        """
+        return nickname.casefold() in self._nickname_keys
+
     def can_start(self) -> bool:
         """Check if the game can be started.
 
@@ -105,7 +202,7 @@ class GameSession:
         Raises:
             ValueError: If game not in lobby or invalid timer value
         """
-        if self.state != GameState.LOBBY:
+        if self.state is not GameState.LOBBY:
             raise ValueError("Can only set timer in lobby")
 
         if seconds is not None and not (30 <= seconds <= 180):
@@ -119,12 +216,10 @@ class GameSession:
         Returns:
             Seconds remaining, or None if no timer active
         """
-        if not self.voting_timer_seconds or not self.voting_started_at:
+        if not self.voting_timer_seconds or self.voting_started_at is None:
             return None
 
-        from datetime import datetime
-
-        elapsed = (datetime.now() - self.voting_started_at).total_seconds()
+        elapsed = time.monotonic() - self.voting_started_at
         remaining = int(self.voting_timer_seconds - elapsed)
 
         return max(0, remaining)  # Don't return negative values
@@ -138,7 +233,7 @@ class GameSession:
         if not self.can_start():
             raise ValueError(f"Need at least {MIN_PLAYERS} players to start")
 
-        if self.state != GameState.LOBBY:
+        if self.state is not GameState.LOBBY:
             raise ValueError("Game has already started")
 
         # Assign roles
@@ -157,7 +252,7 @@ class GameSession:
 
         # Update state
         self.state = GameState.PLAYING
-        self.started_at = datetime.now()
+        self.started_at = time.monotonic()
 
     def submit_vote(self, voter_id: str, target_id: str) -> None:
         """Submit a vote to eliminate a player.
@@ -169,7 +264,7 @@ class GameSession:
         Raises:
             ValueError: If voting is not allowed
         """
-        if self.state != GameState.VOTING:
+        if self.state is not GameState.VOTING:
             raise ValueError("Not in voting phase")
 
         voter = self.players.get(voter_id)
@@ -224,7 +319,6 @@ class GameSession:
         Returns:
             "villagers", "dragon", or None if game continues
         """
-        alive_players = [p for p in self.players.values() if p.is_alive]
         dragon = next((p for p in self.players.values() if p.role == Role.DRAGON.value), None)
 
         # Dragon was eliminated
@@ -233,25 +327,52 @@ class GameSession:
             return None  # Will transition to DRAGON_GUESS state
 
         # Only 2 players left and Dragon is alive
-        if len(alive_players) <= 2 and dragon and dragon.is_alive:
+        if self.alive_count <= 2 and dragon and dragon.is_alive:
             return "dragon"
 
         return None  # Game continues
 
-    def get_state_for_player(self, player_id: str) -> dict:
-        """Get game state customized for a specific player.
+    def get_shared_state(self) -> dict:
+        """Get the portion of the game state that is identical for every player.
+
+        Returns:
+            Dictionary with the shared game state
+        """
+        finished = self.state is GameState.FINISHED
+
+        shared_state = {
+            "game_id": self.game_id,
+            "state": self.state.value,
+            "players": [p.to_dict(include_role=finished) for p in self.players.values()],
+            "player_count": len(self.players),
+            "alive_count": self.alive_count,
+            "can_start": self.can_start(),
+            "votes_submitted": len(self.votes),
+            "last_elimination": self.last_elimination,
+            "player_order": self.player_order,  # Turn order for word-saying phase
+            "voting_timer_seconds": self.voting_timer_seconds,
+        }
+
+        if finished:
+            shared_state["winner"] = self.winner
+            shared_state["villager_word"] = self.villager_word
+            shared_state["knight_word"] = self.knight_word
+            shared_state["dragon_guess"] = self.dragon_guess
+
+        return shared_state
+
+    def get_personal_state(self, player_id: str) -> dict | None:
+        """Get the portion of the game state that is specific to one player.
 
         Args:
             player_id: ID of the player to get state for
 
         Returns:
-            Dictionary with game state
+            Dictionary with the player's own fields, or None if not in the game
         """
         player = self.players.get(player_id)
         if not player:
-            return {}
-
-        alive_count = sum(1 for p in self.players.values() if p.is_alive)
+            return None
 
         # Determine which word to show based on role
         your_word = None
@@ -261,58 +382,103 @@ class GameSession:
             else:  # Villager
                 your_word = self.villager_word
 
-        state_data = {
-            "game_id": self.game_id,
-            "state": self.state.value,
+        return {
             "your_id": player_id,
             "your_role": player.role,
             "your_word": your_word,
             "is_host": player.is_host,
             "is_alive": player.is_alive,
-            "players": [p.to_dict() for p in self.players.values()],
-            "player_count": len(self.players),
-            "alive_count": alive_count,
-            "can_start": self.can_start(),
-            "votes_submitted": len(self.votes),
             "has_voted": player_id in self.votes,
-            "last_elimination": self.last_elimination,
-            "player_order": self.player_order,  # Turn order for word-saying phase
-            "voting_timer_seconds": self.voting_timer_seconds,
         }
 
-        if self.state == GameState.FINISHED:
-            state_data["winner"] = self.winner
-            state_data["villager_word"] = self.villager_word
-            state_data["knight_word"] = self.knight_word
-            state_data["dragon_guess"] = self.dragon_guess
-            state_data["players"] = [p.to_dict(include_role=True) for p in self.players.values()]
+    def get_state_for_player(self, player_id: str) -> dict:
+        """Get game state customized for a specific player.
+
+        This is the unserialized reference form of get_state_message; sends
+        go through get_state_message and broadcast_state instead.
+
+        Args:
+            player_id: ID of the player to get state for
+
+        Returns:
+            Dictionary with game state
+        """
+        personal_state = self.get_personal_state(player_id)
+        if personal_state is None:
+            return {}
+
+        return {**self.get_shared_state(), **personal_state}
+
+    def _build_state_message(self, shared_json: bytes, player_id: str) -> bytes:
+        """Build a serialized state_update message for one player.
+
+        The shared state is serialized once per broadcast; only the small
+        personal object is serialized per player and spliced into it.
+
+        Args:
+            shared_json: orjson-serialized result of get_shared_state
+            player_id: ID of the player the message is for
+
+        Returns:
+            UTF-8 JSON message bytes
+        """
+        personal_state = self.get_personal_state(player_id)
+        if personal_state is None:
+            return _EMPTY_STATE_MESSAGE
 
-        return state_data
+        # Merge '{shared...}' and '{personal...}' into '{shared..., personal...}'
+        personal_json = orjson.dumps(personal_state)
+        return b"".join((_STATE_MESSAGE_PREFIX, shared_json[:-1], b",", personal_json[1:], b"}"))
+
+    def get_state_message(self, player_id: str) -> bytes:
+        """Get the serialized state_update message for a single player.
+
+        Args:
+            player_id: ID of the player the message is for
+
+        Returns:
+            UTF-8 JSON message bytes, ready to send as a binary frame
+        """
+        if player_id not in self.players:
+            return _EMPTY_STATE_MESSAGE
+
+        return self._build_state_message(orjson.dumps(self.get_shared_state()), player_id)
 
     async def broadcast_state(self) -> None:
         """Broadcast current game state to all connected players."""
-        print(
-            f"📢 Broadcasting state for game {self.game_id} to {len(self.connections)} connections"
+        logger.debug(
+            "📢 Broadcasting state for game %s (%s) to %d connections",
+            self.game_id,
+            self.state.value,
+            len(self.connections),
         )
-        print(f"   Game state: {self.state.value}")
-
-        disconnected = []
-
-        for player_id, websocket in self.connections.items():
-            try:
-                state = self.get_state_for_player(player_id)
-                message = json.dumps({"type": "state_update", "data": state})
-                await websocket.send_text(message)
-                print(f"   ✅ Sent to {player_id}")
-            except Exception as e:
-                print(f"   ❌ Failed to send to {player_id}: {e}")
-                # Mark for removal if send fails
-                disconnected.append(player_id)
-
-        # Remove disconnected players
-        for player_id in disconnected:
-            del self.connections[player_id]
-            print(f"   🗑️ Removed disconnected player: {player_id}")
+
+        # Serialize the shared state once; only the per-player fields differ.
+        # orjson produces UTF-8 bytes directly, which go out as binary frames.
+        shared_json = orjson.dumps(self.get_shared_state())
+
+        # Snapshot connections so they can change while sends are in flight
+        connections = list(self.connections.items())
+        messages = [
+            self._build_state_message(shared_json, player_id) for player_id, _ in connections
+        ]
+
+        # Send to all players concurrently so one slow socket doesn't delay the rest
+        results = await asyncio.gather(
+            *(
+                websocket.send_bytes(message)
+                for (_, websocket), message in zip(connections, messages, strict=True)
+            ),
+            return_exceptions=True,
+        )
+
+        for (player_id, websocket), result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                logger.debug("❌ Failed to send to %s: %s", player_id, result)
+                # Remove the failed connection unless the player has already reconnected
+                if self.connections.get(player_id) is websocket:
+                    del self.connections[player_id]
+                    logger.debug("🗑️ Removed disconnected player: %s", player_id)
 
     def __repr__(self) -> str:
         return f"GameSession(id={self.game_id}, state={self.state}, players={len(self.players)})"
@@ -1,7 +1,12 @@
 """Player model for the game."""
 
+import time
 import uuid
-from datetime import datetime
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_session import GameSession
 
 
 class Player:
@@ -17,10 +22,41 @@ class Player:
         self.id: str = str(uuid.uuid4())
         self.nickname: str = nickname
         self.role: str | None = None  # Will be set when game starts
-        self.is_alive: bool = True
+        self._is_alive: bool = True
         self.is_host: bool = is_host
         self.knows_word: bool = False  # False for Dragon, True for others
-        self.joined_at: datetime = datetime.now()
+        self.joined_at: float = time.monotonic()  # Same clock as GameSession timestamps
+
+        # Session notified when is_alive flips so it can keep its alive count
+        self._session_ref: weakref.ref[GameSession] | None = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the player is still in the game."""
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, value: bool) -> None:
+        """Set whether the player is alive, notifying the session on change.
+
+        Args:
+            value: True if alive, False if eliminated
+        """
+        if value == self._is_alive:
+            return
+
+        self._is_alive = value
+        session = self._session_ref() if self._session_ref else None
+        if session:
+            session.notify_alive_changed(1 if value else -1)
+
+    def attach_session(self, session: "GameSession | None") -> None:
+        """Register (or clear) the session tracking this player's alive state.
+
+        Args:
+            session: The GameSession this player belongs to, or None to detach
+        """
+        self._session_ref = weakref.ref(session) if session else None
 
     def to_dict(self, include_role: bool = False) -> dict:
         """Convert player to dictionary for API responses.
@@ -0,0 +1,51 @@
+"""Shared Jinja2 templates used by the app and all routers."""
+
+import os
+from functools import cache
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# Template edits are only picked up without a restart in development
+_IS_DEVELOPMENT = os.getenv("ENVIRONMENT") == "development"
+
+# Compiled template bytecode is cached on disk across restarts; outside
+# development, loaded templates are not re-checked against the files
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader("templates"),
+        autoescape=True,
+        auto_reload=_IS_DEVELOPMENT,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+)
+
+
+@cache
+def _render_once(name: str) -> str:
+    """Render a template and keep the result for the life of the process.
+
+    Args:
+        name: Template file name
+
+    Returns:
+        Rendered HTML
+    """
+    return templates.get_template(name).render()
+
+
+def render_static_template(name: str) -> str:
+    """Render a template that has no per-request content.
+
+    The result is rendered once and reused, except in development so that
+    template edits show up without a restart.
+
+    Args:
+        name: Template file name
+
+    Returns:
+        Rendered HTML
+    """
+    if _IS_DEVELOPMENT:
+        return templates.get_template(name).render()
+    return _render_once(name)
@@ -1,9 +1,12 @@
 """Custom rate limiting middleware using only built-in Python features."""
 
+import math
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
 
-from fastapi.responses import JSONResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 
@@ -12,12 +15,14 @@ class RateLimiter:
 
     def __init__(self):
         """Initialize rate limiter with request tracking."""
-        # Dictionary: IP -> list of request timestamps
-        self.requests: dict[str, list[float]] = defaultdict(list)
-        self.last_cleanup = time.time()
+        # Dictionary: IP -> request timestamps, oldest first
+        self.requests: dict[str, deque[float]] = defaultdict(deque)
+        self.last_cleanup = time.monotonic()
         self.cleanup_interval = 60  # Clean up every 60 seconds
+        self.cleanup_batch_size = 1000  # Max IPs examined per cleanup call
+        self._cleanup_cursor: Iterator[str] | None = None  # Sweep in progress, if any
 
-    def is_allowed(self, ip: str, limit: int, window: float = 1.0) -> bool:
+    def is_allowed(self, ip: str, limit: int, window: float = 1.0) -> tuple[bool, int, int]:
         """Check if request is allowed under rate limit.
 
         Args:
@@ -26,61 +31,99 @@ class RateLimiter:
             window: Time window in seconds (default: 1.0)
 
         Returns:
-            True if request is allowed, False if rate limit exceeded
+            Tuple of (allowed, remaining requests in window, milliseconds until
+            the oldest request in the window expires)
         """
-        now = time.time()
+        now = time.monotonic()
         cutoff = now - window
+        timestamps = self.requests[ip]
 
-        # Clean up old requests for this IP
-        self.requests[ip] = [ts for ts in self.requests[ip] if ts > cutoff]
+        # Drop expired requests for this IP (timestamps are appended in order)
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
         # Check if under limit
-        if len(self.requests[ip]) >= limit:
-            return False
+        if len(timestamps) >= limit:
+            return False, 0, math.ceil((timestamps[0] + window - now) * 1000)
 
         # Record this request
-        self.requests[ip].append(now)
-        return True
+        timestamps.append(now)
+        return True, limit - len(timestamps), math.ceil((timestamps[0] + window - now) * 1000)
 
     def cleanup_old_entries(self):
-        """Remove stale IP entries to prevent memory leaks."""
-        now = time.time()
+        """Remove stale IP entries to prevent memory leaks.
 
-        # Only run cleanup periodically
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
+        The sweep is spread over several calls, examining at most
+        cleanup_batch_size IPs per call, so a large table never blocks a
+        single request for long.
+        """
+        now = time.monotonic()
+
+        # Only start a new sweep periodically (an unfinished sweep continues every call)
+        if self._cleanup_cursor is None:
+            if now - self.last_cleanup < self.cleanup_interval:
+                return
+            self._cleanup_cursor = iter(list(self.requests))
 
         cutoff = now - 60  # Remove IPs with no requests in last 60 seconds
 
-        # Find IPs to remove
-        to_remove = [
-            ip
-            for ip, timestamps in self.requests.items()
-            if not timestamps or max(timestamps) < cutoff
-        ]
+        examined = 0
+        for ip in islice(self._cleanup_cursor, self.cleanup_batch_size):
+            examined += 1
+            timestamps = self.requests.get(ip)
+            if timestamps is not None and (not timestamps or timestamps[-1] < cutoff):
+                del self.requests[ip]
+
+        # Sweep finished
+        if examined < self.cleanup_batch_size:
+            self._cleanup_cursor = None
+            self.last_cleanup = now
+
+
+# Paths that are never rate limited (WebSocket connections and static files)
+_EXEMPT_PREFIXES = ("/ws", "/static")
+
+# Exact-match limits
+_EXACT_LIMITS = {
+    "/health": 10,  # Health check gets moderate limit
+}
+
+# Prefix limits, checked in order (specific before general)
+_PREFIX_LIMITS = (
+    # API endpoints need high limit for 12 players
+    # (voting, joining, etc. - all players might act simultaneously)
+    ("/api", 20),  # 12 players + overhead
+    # Page views need high limit (all players load pages after game state changes)
+    ("/game/", 25),  # 12 players + overhead
+)
 
-        # Remove stale entries
-        for ip in to_remove:
-            del self.requests[ip]
+# Default limit for other endpoints
+_DEFAULT_LIMIT = 5
 
-        self.last_cleanup = now
+# Prebuilt parts of the 429 response, sent as raw ASGI messages
+_RATE_LIMITED_BODY = b'{"detail":"Rate limit exceeded. Please try again later."}'
+_RATE_LIMITED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+    (b"retry-after", b"1"),  # Limits use 1 second windows
+    (b"x-ratelimit-remaining", b"0"),
+]
+_RATE_LIMITED_BODY_MESSAGE = {"type": "http.response.body", "body": _RATE_LIMITED_BODY}
 
 
+@lru_cache(maxsize=512)
 def get_rate_limit(path: str) -> int | None:
     """Get rate limit for endpoint.
 
+    Results are memoized per path since the same routes are hit repeatedly.
+
     Args:
         path: Request path
 
     Returns:
         Requests per second limit, or None to skip rate limiting
     """
-    # No rate limiting for WebSocket connections
-    if path.startswith("/ws"):
-        return None
-
-    # No rate limiting for static files
-    if path.startswith("/static"):
+    if path.startswith(_EXEMPT_PREFIXES):
         return None
 
     # Timer endpoint needs high limit (1 req/sec per player)
@@ -88,29 +131,25 @@ def get_rate_limit(path: str) -> int | None:
     if "/timer" in path:
         return 30  # 12 players * 1 req/s + buffer
 
-    # Health check gets moderate limit
-    if path == "/health":
-        return 10
+    limit = _EXACT_LIMITS.get(path)
+    if limit is not None:
+        return limit
 
     # Game creation gets very strict limit (prevent spam)
     if "/games/create" in path:
         return 2  # Only 2 games per second per IP
 
-    # API endpoints need high limit for 12 players
-    # (voting, joining, etc. - all players might act simultaneously)
-    if path.startswith("/api"):
-        return 20  # 12 players + overhead
+    for prefix, limit in _PREFIX_LIMITS:
+        if path.startswith(prefix):
+            return limit
 
-    # Page views need high limit (all players load pages after game state changes)
-    if path.startswith("/game/"):
-        return 25  # 12 players + overhead
+    return _DEFAULT_LIMIT
 
-    # Default limit for other endpoints
-    return 5
 
-
-# Shared rate limiter instance
+# Shared rate limiter instance (bound methods cached for the per-request path)
 _rate_limiter = RateLimiter()
+_is_allowed = _rate_limiter.is_allowed
+_cleanup_old_entries = _rate_limiter.cleanup_old_entries
 
 
 class RateLimitMiddleware:
@@ -137,30 +176,39 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Get client IP from scope
-        client_ip = scope.get("client", ["unknown"])[0] if scope.get("client") else "unknown"
-
-        # Get rate limit for this path
-        path = scope.get("path", "")
-        limit = get_rate_limit(path)
+        # Get rate limit for this path (exempt paths skip the lookup entirely)
+        path = scope["path"]
+        limit = None if path.startswith(_EXEMPT_PREFIXES) else get_rate_limit(path)
 
         # Skip rate limiting if no limit configured
         if limit is None:
             await self.app(scope, receive, send)
             return
 
+        # Get client IP from scope
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
         # Check rate limit
-        if not _rate_limiter.is_allowed(client_ip, limit):
-            # Send rate limit exceeded response
-            response = JSONResponse(
-                status_code=429,
-                content={"detail": "Rate limit exceeded. Please try again later."},
+        allowed, _, reset_ms = _is_allowed(client_ip, limit)
+        if not allowed:
+            # Send rate limit exceeded response, telling clients when to retry
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        *_RATE_LIMITED_HEADERS,
+                        (b"x-ratelimit-limit", str(limit).encode()),
+                        (b"x-ratelimit-reset", str(math.ceil(reset_ms / 1000)).encode()),
+                    ],
+                }
             )
-            await response(scope, receive, send)
+            await send(_RATE_LIMITED_BODY_MESSAGE)
             return
 
         # Periodic cleanup
-        _rate_limiter.cleanup_old_entries()
+        _cleanup_old_entries()
 
         # Process request
         await self.app(scope, receive, send)
@@ -1,58 +1,72 @@
 """Security headers middleware."""
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# Content Security Policy - restrict resource loading
+_CSP = (
+    b"default-src 'self'; "
+    b"script-src 'self' 'unsafe-inline' https://unpkg.com "
+    b"https://cdn.tailwindcss.com; "
+    b"style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net "
+    b"https://cdn.tailwindcss.com; "
+    b"connect-src 'self' wss://dragonseeker.win ws://localhost:8000 "
+    b"ws://127.0.0.1:8000; "
+    b"img-src 'self' data:; "
+    b"font-src 'self' https://cdn.jsdelivr.net; "
+    b"frame-ancestors 'none'"
+)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+# Headers added to every HTTP response (raw ASGI header pairs, built once at import)
+_STATIC_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"content-security-policy", _CSP),
+    # Prevent clickjacking
+    (b"x-frame-options", b"DENY"),
+    # Prevent MIME type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Enable browser XSS protection
+    (b"x-xss-protection", b"1; mode=block"),
+    # Referrer Policy - limit referrer information
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    # Permissions Policy - disable unnecessary browser features
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=(), payment=()"),
+]
 
-    async def dispatch(self, request: Request, call_next):
-        """Add security headers to response.
+# HSTS - Force HTTPS (only in production)
+_HSTS_HEADERS: list[tuple[bytes, bytes]] = [
+    *_STATIC_HEADERS,
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware to add security headers to all responses."""
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware/handler
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response start message.
 
-        Returns:
-            Response with security headers
+        Args:
+            scope: ASGI scope dictionary
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        response: Response = await call_next(request)
-
-        # Content Security Policy - restrict resource loading
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://unpkg.com "
-            "https://cdn.tailwindcss.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net "
-            "https://cdn.tailwindcss.com; "
-            "connect-src 'self' wss://dragonseeker.win ws://localhost:8000 "
-            "ws://127.0.0.1:8000; "
-            "img-src 'self' data:; "
-            "font-src 'self' https://cdn.jsdelivr.net; "
-            "frame-ancestors 'none'"
-        )
-
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # Enable browser XSS protection
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # HSTS - Force HTTPS (only in production)
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # Referrer Policy - limit referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Permissions Policy - disable unnecessary browser features
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=(), payment=()"
-        )
-
-        return response
+        # Only HTTP responses carry headers
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = _HSTS_HEADERS if scope.get("scheme") == "https" else _STATIC_HEADERS
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
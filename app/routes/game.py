@@ -1,13 +1,32 @@
 """Routes for game creation and joining."""
 
-from fastapi import APIRouter, Form, HTTPException, Request, Response
-from fastapi.templating import Jinja2Templates
+import os
+import string
+
+from fastapi import APIRouter, Form, HTTPException, Response
+from fastapi.responses import HTMLResponse
 
 from core.auth import generate_player_token, get_secret_key
 from core.game_manager import game_manager
+from core.game_session import GameState
+from core.templates import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Auth cookies are HTTPS-only by default; set ENVIRONMENT=development to allow HTTP
+_IS_DEVELOPMENT = os.getenv("ENVIRONMENT") == "development"
+_COOKIE_SECURE = not _IS_DEVELOPMENT
+
+# Auth cookie attributes are the same for every player (24 hour lifetime), so the
+# Set-Cookie suffix is built once instead of through Response.set_cookie per join
+_COOKIE_ATTRIBUTES = b"; HttpOnly; Max-Age=86400; Path=/; SameSite=lax" + (
+    b"; Secure" if _COOKIE_SECURE else b""
+)
+
+# Deletes every ASCII character allowed in a nickname; anything left over needs a closer look
+_NICKNAME_ASCII_TABLE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + string.whitespace + ".,!?'-_"
+)
 
 
 @router.post("/api/games/create")
@@ -26,11 +45,10 @@ async def create_game(response: Response):
 
 
 @router.get("/game/{game_id}/join")
-async def show_join_page(request: Request, game_id: str):
+async def show_join_page(game_id: str):
     """Show the join page where players enter their nickname.
 
     Args:
-        request: The FastAPI request object
         game_id: The game session ID
 
     Returns:
@@ -44,12 +62,11 @@ async def show_join_page(request: Request, game_id: str):
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if game.state.value != "lobby":
+    if game.state is not GameState.LOBBY:
         raise HTTPException(status_code=400, detail="Game has already started")
 
-    return templates.TemplateResponse(
-        request=request, name="join.html", context={"game_id": game_id}
-    )
+    # The environment keeps the compiled template loaded (and reloads it in development)
+    return HTMLResponse(templates.get_template("join.html").render(game_id=game_id))
 
 
 @router.post("/api/games/{game_id}/join")
@@ -72,7 +89,7 @@ async def join_game(game_id: str, response: Response, nickname: str = Form(...))
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if game.state.value != "lobby":
+    if game.state is not GameState.LOBBY:
         raise HTTPException(status_code=400, detail="Game has already started")
 
     # Validate nickname
@@ -82,14 +99,15 @@ async def join_game(game_id: str, response: Response, nickname: str = Form(...))
 
     # Validate characters (alphanumeric, spaces, and common punctuation only)
     # Prevents control characters, zero-width spaces, and confusing Unicode
-    if not all(c.isalnum() or c.isspace() or c in ".,!?'-_" for c in nickname):
+    leftover = nickname.translate(_NICKNAME_ASCII_TABLE)
+    if leftover and not all(c.isalnum() or c.isspace() for c in leftover):
         raise HTTPException(
             status_code=400,
             detail="Nickname contains invalid characters",
         )
 
     # Check for duplicate nicknames
-    if any(p.nickname.lower() == nickname.lower() for p in game.players.values()):
+    if game.is_nickname_taken(nickname):
         raise HTTPException(status_code=400, detail="Nickname already taken")
 
     # Add player
@@ -101,23 +119,17 @@ async def join_game(game_id: str, response: Response, nickname: str = Form(...))
 
     # Set authentication cookie (HTTP-only for security)
     # Use player_id in cookie name to avoid collision when testing multiple players in same browser
-    # Note: secure=True by default (production), set ENVIRONMENT=development to allow HTTP
-    import os
-
-    is_development = os.getenv("ENVIRONMENT") == "development"
-    response.set_cookie(
-        key=f"player_token_{player.id}",
-        value=token,
-        httponly=True,
-        secure=not is_development,  # HTTPS by default, HTTP only in development
-        samesite="lax",
-        max_age=86400,  # 24 hours
+    # (token characters are all cookie-safe, so the value needs no quoting)
+    response.raw_headers.append(
+        (b"set-cookie", f"player_token_{player.id}={token}".encode() + _COOKIE_ATTRIBUTES)
     )
 
     # Broadcast update to all connected players
     await game.broadcast_state()
 
     # Use HTMX's HX-Redirect header for client-side redirect
-    response.headers["HX-Redirect"] = f"/game/{game_id}/lobby?player_id={player.id}"
+    response.raw_headers.append(
+        (b"hx-redirect", f"/game/{game_id}/lobby?player_id={player.id}".encode())
+    )
 
     return {"status": "joined", "player_id": player.id}
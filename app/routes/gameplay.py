@@ -1,15 +1,16 @@
 """Routes for active gameplay (voting, guessing, etc.)."""
 
+import time
 from typing import Any
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from core.auth import get_token_data, verify_token_matches
 from core.game_manager import game_manager
 from core.game_session import GameState
 from core.roles import Role
+from core.templates import templates
 from services.game_state import (
     can_start_voting,
     transition_to_finished,
@@ -20,7 +21,6 @@ from services.voting import all_votes_submitted, can_vote
 from services.win_conditions import check_dragon_eliminated, determine_winner
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/game/{game_id}/play")
@@ -58,11 +58,11 @@ async def show_game(
         raise HTTPException(status_code=403, detail="Not in this game")
 
     # Redirect to lobby if game hasn't started
-    if game.state == GameState.LOBBY:
+    if game.state is GameState.LOBBY:
         return RedirectResponse(url=f"/game/{game_id}/lobby?player_id={player_id}")
 
     # Redirect to results if game is finished
-    if game.state == GameState.FINISHED:
+    if game.state is GameState.FINISHED:
         return RedirectResponse(url=f"/game/{game_id}/results?player_id={player_id}")
 
     # Determine which word to show based on player's role
@@ -123,10 +123,8 @@ async def start_voting(
 
     # Set voting start timestamp if timer configured
     if game.voting_timer_seconds is not None:
-        from datetime import datetime
-
-        game.voting_started_at = datetime.now()
-        print(f"⏱️ Starting timer: {game.voting_timer_seconds}s at {game.voting_started_at}")
+        game.voting_started_at = time.monotonic()
+        print(f"⏱️ Starting timer: {game.voting_timer_seconds}s")
     else:
         print("⏱️ No timer configured (voting_timer_seconds is None)")
 
@@ -181,7 +179,7 @@ async def get_timer(request: Request, game_id: str, player_id: str = Query(...))
         )
 
     # Check if in voting state with timer
-    if game.state != GameState.VOTING or not game.voting_timer_seconds:
+    if game.state is not GameState.VOTING or not game.voting_timer_seconds:
         return templates.TemplateResponse(
             request=request,
             name="partials/timer.html",
@@ -307,11 +305,10 @@ async def submit_vote(
     # Vote submitted, waiting for others
     await game.broadcast_state()
 
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
     return {
         "status": "vote_submitted",
         "votes_submitted": len(game.votes),
-        "total_players": alive_count,
+        "total_players": game.alive_count,
     }
 
 
@@ -351,7 +348,7 @@ async def guess_word(
     if not player or player.role != Role.DRAGON.value:
         raise HTTPException(status_code=403, detail="Only Dragon can guess the word")
 
-    if game.state != GameState.DRAGON_GUESS:
+    if game.state is not GameState.DRAGON_GUESS:
         raise HTTPException(status_code=400, detail="Not in dragon guess phase")
 
     if not game.villager_word:
@@ -2,16 +2,16 @@
 
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from core.auth import get_token_data, verify_token_matches
 from core.game_manager import game_manager
+from core.templates import templates
 from services.game_state import can_start_game
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/game/{game_id}/lobby")
@@ -152,7 +152,14 @@ async def set_timer(
     if not player or not player.is_host:
         raise HTTPException(status_code=403, detail="Only host can set timer")
 
-    body = await request.json()
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail="Invalid JSON body") from e
+
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
     timer_seconds = body.get("timer_seconds")
 
     print(f"⏱️ Setting timer for game {game_id}: {timer_seconds}s")
@@ -1,13 +1,16 @@
 """WebSocket routes for real-time game updates."""
 
 import asyncio
-import json
+import logging
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket
 
 from core.auth import get_secret_key, verify_player_token
+from core.constants import WEBSOCKET_IDLE_TIMEOUT_SECONDS
 from core.game_manager import game_manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -28,7 +31,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
         5. Keep connection alive with ping/pong
         6. Remove connection on disconnect
     """
-    print(f"🔌 WebSocket connection attempt: game={game_id}, player={player_id}")
+    logger.debug("🔌 WebSocket connection attempt: game=%s, player=%s", game_id, player_id)
 
     # Authenticate player via cookie (use player-specific cookie name)
     cookie_name = f"player_token_{player_id}"
@@ -37,79 +40,91 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
     token_data = verify_player_token(player_token, secret_key)
 
     if not token_data:
-        print(f"❌ Invalid or expired token for player: {player_id}")
+        logger.debug("❌ Invalid or expired token for player: %s", player_id)
         await websocket.close(code=1008, reason="Invalid or expired authentication token")
         return
 
     if token_data["game_id"] != game_id or token_data["player_id"] != player_id:
-        print(f"❌ Token mismatch for player: {player_id}")
+        logger.debug("❌ Token mismatch for player: %s", player_id)
         await websocket.close(code=1008, reason="Authentication token does not match player")
         return
 
-    game = game_manager.get_game(game_id)
-
     # Validate game exists and player is in game
-    if not game:
-        print(f"❌ Game not found: {game_id}")
+    found = game_manager.get_game_and_player(game_id, player_id)
+    if found is None:
+        logger.debug("❌ Game not found: %s", game_id)
         await websocket.close(code=4004, reason="Game not found")
         return
 
-    if player_id not in game.players:
-        print(f"❌ Player not in game: {player_id}")
+    game, player = found
+    if player is None:
+        logger.debug("❌ Player not in game: %s", player_id)
         await websocket.close(code=4004, reason="Player not in game")
         return
 
     # Accept connection
     await websocket.accept()
-    print(f"✅ WebSocket connected: {player_id} in game {game_id}")
+    logger.debug("✅ WebSocket connected: %s in game %s", player_id, game_id)
 
     # Register WebSocket connection
     game.connections[player_id] = websocket
-    print(f"📊 Active connections in game {game_id}: {len(game.connections)}")
+    logger.debug("📊 Active connections in game %s: %d", game_id, len(game.connections))
 
-    try:
-        # Send initial state to player
-        initial_state = game.get_state_for_player(player_id)
-        message = json.dumps({"type": "state_update", "data": initial_state})
-        await websocket.send_text(message)
-        print(f"📤 Sent initial state to {player_id}")
+    # Close idle connections from a single watchdog task instead of wrapping
+    # every receive in asyncio.wait_for; messages only refresh the timestamp
+    loop = asyncio.get_running_loop()
+    last_activity = loop.time()
 
-        # Keep connection alive and handle messages
+    async def close_when_idle() -> None:
         while True:
-            try:
-                # Receive messages with timeout (close idle connections after 5 minutes)
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=300.0,  # 5 minutes
+            idle_for = loop.time() - last_activity
+            if idle_for >= WEBSOCKET_IDLE_TIMEOUT_SECONDS:
+                logger.debug(
+                    "⏱️ WebSocket timeout for %s (no activity for %d seconds)",
+                    player_id,
+                    WEBSOCKET_IDLE_TIMEOUT_SECONDS,
                 )
+                try:
+                    await websocket.close(code=1000, reason="Connection timeout")
+                except Exception as e:
+                    # The client may have disconnected at the same moment
+                    logger.debug("❌ Failed to close idle WebSocket for %s: %s", player_id, e)
+                return
+            await asyncio.sleep(WEBSOCKET_IDLE_TIMEOUT_SECONDS - idle_for)
 
-                # Validate message size (prevent DoS)
-                if len(data) > 1024:  # 1KB max
-                    print(f"⚠️ Message too large from {player_id}: {len(data)} bytes")
-                    await websocket.close(code=1009, reason="Message too large")
-                    break
+    watchdog = asyncio.create_task(close_when_idle())
 
-                print(f"📥 Received from {player_id}: {data}")
+    try:
+        # Send initial state to player (same binary frame format as broadcasts)
+        await websocket.send_bytes(game.get_state_message(player_id))
+        logger.debug("📤 Sent initial state to %s", player_id)
+
+        # Handle messages until the client disconnects
+        async for data in websocket.iter_text():
+            last_activity = loop.time()
+
+            # Validate message size (prevent DoS)
+            if len(data) > 1024:  # 1KB max
+                logger.debug("⚠️ Message too large from %s: %d bytes", player_id, len(data))
+                await websocket.close(code=1009, reason="Message too large")
+                break
 
-                # Handle ping/pong
-                if data == "ping":
-                    await websocket.send_text("pong")
+            logger.debug("📥 Received from %s: %s", player_id, data)
 
-            except TimeoutError:
-                print(f"⏱️ WebSocket timeout for {player_id} (no activity for 5 minutes)")
-                await websocket.close(code=1000, reason="Connection timeout")
-                break
+            # Handle ping/pong
+            if data == "ping":
+                await websocket.send_text("pong")
 
-            except WebSocketDisconnect:
-                print(f"🔌 WebSocket disconnected: {player_id}")
-                break
+        logger.debug("🔌 WebSocket disconnected: %s", player_id)
 
     except Exception as e:
-        print(f"❌ WebSocket error for player {player_id}: {e}")
+        logger.warning("❌ WebSocket error for player %s: %s", player_id, e)
 
     finally:
-        # Remove connection when disconnected
-        if player_id in game.connections:
+        watchdog.cancel()
+
+        # Remove connection when disconnected (unless the player has already reconnected)
+        if game.connections.get(player_id) is websocket:
             del game.connections[player_id]
-            print(f"🗑️ Removed connection for {player_id}")
-            print(f"📊 Remaining connections: {len(game.connections)}")
+            logger.debug("🗑️ Removed connection for %s", player_id)
+            logger.debug("📊 Remaining connections: %d", len(game.connections))
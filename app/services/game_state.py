@@ -1,7 +1,6 @@
 """Game state transition helpers."""
 
-from datetime import datetime
-
+from core.constants import MIN_PLAYERS
 from core.game_session import GameSession, GameState
 
 
@@ -14,11 +13,11 @@ def can_start_game(game: GameSession) -> tuple[bool, str]:
     Returns:
         Tuple of (can_start, error_message)
     """
-    if game.state != GameState.LOBBY:
+    if game.state is not GameState.LOBBY:
         return False, "Game has already started"
 
     if not game.can_start():
-        return False, f"Need at least {game.can_start()} players to start"
+        return False, f"Need at least {MIN_PLAYERS} players to start"
 
     return True, ""
 
@@ -32,11 +31,10 @@ def can_start_voting(game: GameSession) -> tuple[bool, str]:
     Returns:
         Tuple of (can_start_voting, error_message)
     """
-    if game.state != GameState.PLAYING:
+    if game.state is not GameState.PLAYING:
         return False, "Can only start voting from playing state"
 
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
-    if alive_count < 2:
+    if game.alive_count < 2:
         return False, "Need at least 2 alive players to vote"
 
     return True, ""
@@ -69,6 +67,5 @@ def transition_to_finished(game: GameSession, winner: str) -> None:
         game: The game session
         winner: "dragon" or "villagers"
     """
-    game.state = GameState.FINISHED
+    game.state = GameState.FINISHED  # Also records game.finished_at
     game.winner = winner
-    game.finished_at = datetime.now()
@@ -13,7 +13,7 @@ def can_vote(game: GameSession, player_id: str) -> tuple[bool, str | None]:
     Returns:
         Tuple of (can_vote, error_message)
     """
-    if game.state != GameState.VOTING:
+    if game.state is not GameState.VOTING:
         return False, "Not in voting phase"
 
     player = game.players.get(player_id)
@@ -38,5 +38,4 @@ def all_votes_submitted(game: GameSession) -> bool:
     Returns:
         True if all alive players have submitted votes
     """
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
-    return len(game.votes) >= alive_count
+    return len(game.votes) >= game.alive_count
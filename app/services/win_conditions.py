@@ -26,10 +26,9 @@ def check_dragon_survived(game: GameSession) -> bool:
     Returns:
         True if dragon is alive and only 2 or fewer players remain
     """
-    alive_players = [p for p in game.players.values() if p.is_alive]
     dragon = next((p for p in game.players.values() if p.role == Role.DRAGON.value), None)
 
-    return dragon is not None and dragon.is_alive and len(alive_players) <= 2
+    return dragon is not None and dragon.is_alive and game.alive_count <= 2
 
 
 def determine_winner(game: GameSession) -> str | None:
@@ -13,6 +13,7 @@ class GameWebSocket {
         this.reconnectDelay = 1000; // Start with 1 second
         this.isConnecting = false;
         this.previousState = null; // Track previous state to detect transitions
+        this.textDecoder = new TextDecoder(); // State updates arrive as binary (UTF-8 JSON) frames
 
         console.log(`🐉 Initializing WebSocket for game ${gameId}, player ${playerId}`);
         this.connect();
@@ -35,6 +36,7 @@ class GameWebSocket {
 
         try {
             this.ws = new WebSocket(wsUrl);
+            this.ws.binaryType = 'arraybuffer';
 
             this.ws.onopen = (event) => {
                 console.log('✅ WebSocket connected successfully');
@@ -48,13 +50,17 @@ class GameWebSocket {
             };
 
             this.ws.onmessage = (event) => {
+                const data = typeof event.data === 'string'
+                    ? event.data
+                    : this.textDecoder.decode(event.data);
+
                 // Skip logging for timer updates to reduce console noise
-                if (!event.data.includes('timer_update')) {
-                    console.log('📨 WebSocket message received:', event.data);
+                if (!data.includes('timer_update')) {
+                    console.log('📨 WebSocket message received:', data);
                 }
 
                 try {
-                    const message = JSON.parse(event.data);
+                    const message = JSON.parse(data);
 
                     if (message.type === 'state_update') {
                         console.log('📦 Parsed state update:', message);
@@ -1,7 +1,12 @@
 """Pytest configuration and fixtures."""
 
+import os
+
 import pytest
 
+# Allow auth cookies over plain HTTP in tests (read once when the routes are imported)
+os.environ["ENVIRONMENT"] = "development"
+
 from core.game_session import GameSession
 from core.player import Player
 
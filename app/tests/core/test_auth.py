@@ -2,9 +2,19 @@
 
 import time
 
+import pytest
 from fastapi.testclient import TestClient
 
+from core import auth_cache
 from core.auth import generate_player_token, verify_player_token
+from core.game_manager import GameManager
+
+
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Clear cached tokens before each test."""
+    auth_cache.clear_token_cache()
+    yield
 
 
 class TestTokenGeneration:
@@ -78,20 +88,73 @@ class TestTokenGeneration:
         token_data = verify_player_token(expired_token, secret_key)
         assert token_data is None
 
+    def test_tampered_payload_fails_verification(self):
+        """Test that changing the payload invalidates the signature."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+
+        payload, signature_b64 = token.rsplit(".", 1)
+        tampered_token = f"{payload.replace('player456', 'player789')}.{signature_b64}"
+
+        assert verify_player_token(tampered_token, secret_key) is None
+
+
+class TestTokenCache:
+    """Test caching of verified tokens."""
+
+    def test_verified_token_is_cached(self):
+        """Test that a verified token is served from the cache on repeat checks."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        assert auth_cache.get_cached_token(token, secret_key) is None
+
+        token_data = verify_player_token(token, secret_key)
+
+        assert auth_cache.get_cached_token(token, secret_key) == token_data
+        assert verify_player_token(token, secret_key) is token_data
+
+    def test_cached_token_still_rejected_with_wrong_secret(self):
+        """Test that caching a token doesn't make it valid under another secret."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        verify_player_token(token, secret_key)
+
+        assert verify_player_token(token, "wrong_secret_key_12345") is None
+
+    def test_removing_game_invalidates_cached_tokens(self):
+        """Test that cached tokens are dropped when their game is removed."""
+        secret_key = "test_secret_key_12345"
+        manager = GameManager()
+        game = manager.create_game()
+        token = generate_player_token(game.game_id, "player456", secret_key)
+        verify_player_token(token, secret_key)
+
+        manager.remove_game(game.game_id)
+
+        assert auth_cache.get_cached_token(token, secret_key) is None
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used tokens are evicted past the size limit."""
+        monkeypatch.setattr(auth_cache, "MAX_CACHED_TOKENS", 2)
+        secret_key = "test_secret_key_12345"
+        tokens = [generate_player_token("game123", f"player{i}", secret_key) for i in range(3)]
+
+        for token in tokens:
+            verify_player_token(token, secret_key)
+
+        assert auth_cache.get_cached_token(tokens[0], secret_key) is None
+        assert auth_cache.get_cached_token(tokens[2], secret_key) is not None
+
 
 class TestAuthenticationIntegration:
     """Test authentication integration with endpoints."""
 
     def test_authenticated_endpoint_requires_valid_token(self):
         """Test that authenticated endpoints require a valid token."""
-        import os
         import secrets
 
         from app import app
 
-        # Set development environment for testing (allows HTTP cookies)
-        os.environ["ENVIRONMENT"] = "development"
-
         # Initialize secret key for testing (TestClient doesn't run lifespan)
         app.state.secret_key = secrets.token_hex(32)
 
@@ -0,0 +1,111 @@
+"""Tests for the game manager."""
+
+import string
+import time
+
+from core.constants import FINISHED_GAME_TTL_SECONDS, GAME_TTL_SECONDS
+from core.game_manager import GameManager
+from core.game_session import GameState
+
+URL_SAFE_CHARS = set(string.ascii_letters + string.digits + "-_")
+
+
+class TestCreateGame:
+    """Tests for game creation."""
+
+    def test_game_ids_are_unique_and_url_safe(self):
+        """Test that game IDs are unique 8-character URL-safe strings across batches."""
+        manager = GameManager()
+
+        game_ids = {manager.create_game().game_id for _ in range(50)}
+
+        assert len(game_ids) == 50
+        assert all(len(game_id) == 8 for game_id in game_ids)
+        assert all(set(game_id) <= URL_SAFE_CHARS for game_id in game_ids)
+
+
+class TestGetGameAndPlayer:
+    """Test looking up a game and player together."""
+
+    def test_returns_game_and_player(self):
+        """Test that a known game and player are both returned."""
+        manager = GameManager()
+        game = manager.create_game()
+        player = game.add_player("Alice")
+
+        assert manager.get_game_and_player(game.game_id, player.id) == (game, player)
+        assert manager.get_game_and_player(game.game_id, "nobody") == (game, None)
+        assert manager.get_game_and_player("missing", player.id) is None
+
+
+class TestGetStats:
+    """Tests for running game statistics."""
+
+    def test_stats_track_players_and_games(self):
+        """Test that stats follow games and players being added and removed."""
+        manager = GameManager()
+        game = manager.create_game()
+        other_game = manager.create_game()
+        player = game.add_player("Alice")
+        game.add_player("Bob")
+        other_game.add_player("Carol")
+
+        assert manager.get_stats() == {"total_games": 2, "active_games": 2, "total_players": 3}
+
+        game.remove_player(player.id)
+        manager.remove_game(other_game.game_id)
+
+        assert manager.get_stats() == {"total_games": 1, "active_games": 1, "total_players": 1}
+
+    def test_finished_games_are_not_active(self):
+        """Test that finishing a game removes it from the active count."""
+        manager = GameManager()
+        game = manager.create_game()
+
+        game.state = GameState.FINISHED
+        assert manager.get_stats()["active_games"] == 0
+
+        manager.remove_game(game.game_id)
+        assert manager.get_stats() == {"total_games": 0, "active_games": 0, "total_players": 0}
+
+    def test_removed_game_no_longer_updates_stats(self):
+        """Test that a removed game's later changes don't affect the counters."""
+        manager = GameManager()
+        game = manager.create_game()
+        manager.remove_game(game.game_id)
+
+        game.add_player("Alice")
+        game.state = GameState.FINISHED
+
+        assert manager.get_stats() == {"total_games": 0, "active_games": 0, "total_players": 0}
+
+
+class TestCleanupStaleGames:
+    """Tests for removing stale and finished games."""
+
+    def test_removes_expired_games_only(self):
+        """Test that only games past their TTL are removed."""
+        manager = GameManager()
+        fresh = manager.create_game()
+        stale = manager.create_game()
+        finished = manager.create_game()
+
+        stale.created_at = time.monotonic() - GAME_TTL_SECONDS - 1
+        finished.state = GameState.FINISHED
+        finished.finished_at = time.monotonic() - FINISHED_GAME_TTL_SECONDS - 1
+
+        assert manager.cleanup_stale_games() == 2
+        assert list(manager.active_games) == [fresh.game_id]
+        assert manager.finished_games == {}
+
+    def test_finished_games_move_partition(self):
+        """Test that finishing a game moves it to the finished partition."""
+        manager = GameManager()
+        game = manager.create_game()
+
+        game.state = GameState.FINISHED
+
+        assert game.game_id not in manager.active_games
+        assert manager.finished_games[game.game_id] is game
+        assert game.finished_at is not None
+        assert manager.get_game(game.game_id) is game
@@ -0,0 +1,222 @@
+"""Tests for game session state."""
+
+import asyncio
+import json
+import secrets
+from contextlib import ExitStack
+
+from fastapi.testclient import TestClient
+
+from core.game_session import GameState
+from core.player import Player
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a WebSocket that records sent messages."""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.sent: list[bytes] = []
+
+    async def send_bytes(self, message: bytes) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(message)
+
+
+class TestNicknameIndex:
+    """Tests for case-insensitive nickname tracking."""
+
+    def test_nickname_taken_ignores_case(self, game_session):
+        """Test that nicknames are matched case-insensitively."""
+        game_session.add_player("Alice")
+
+        assert game_session.is_nickname_taken("alice")
+        assert game_session.is_nickname_taken("ALICE")
+        assert not game_session.is_nickname_taken("Bob")
+
+    def test_removed_player_frees_nickname(self, game_session):
+        """Test that a nickname can be reused once its player leaves."""
+        player = game_session.add_player("Alice")
+
+        game_session.remove_player(player.id)
+
+        assert not game_session.is_nickname_taken("Alice")
+
+
+class TestAliveCount:
+    """Tests for the running count of alive players."""
+
+    def test_alive_count_follows_player_changes(self, game_with_players):
+        """Test that eliminating, reviving and removing players updates the count."""
+        game, players = game_with_players
+        assert game.alive_count == 5
+
+        players[0].is_alive = False
+        players[0].is_alive = False  # Repeated assignment is not counted twice
+        assert game.alive_count == 4
+
+        players[0].is_alive = True
+        assert game.alive_count == 5
+
+        players[1].is_alive = False
+        game.remove_player(players[1].id)
+        game.remove_player(players[2].id)
+        assert game.alive_count == 3
+        assert game.alive_count == sum(1 for p in game.players.values() if p.is_alive)
+
+    def test_removed_player_no_longer_updates_count(self, game_with_players):
+        """Test that a removed player is detached from the session."""
+        game, players = game_with_players
+        game.remove_player(players[0].id)
+
+        players[0].is_alive = False
+
+        assert game.alive_count == 4
+
+
+class TestGetStateForPlayer:
+    """Tests for per-player state built on top of the shared state."""
+
+    def test_personal_fields_differ_between_players(self, started_game):
+        """Test that personal fields are per player while shared fields match."""
+        player_a, player_b = list(started_game.players.values())[:2]
+
+        state_a = started_game.get_state_for_player(player_a.id)
+        state_b = started_game.get_state_for_player(player_b.id)
+
+        assert state_a["your_id"] == player_a.id
+        assert state_b["your_id"] == player_b.id
+        assert state_a["players"] == state_b["players"]
+
+    def test_roles_revealed_only_when_finished(self, started_game):
+        """Test that player roles are only included once the game is finished."""
+        assert all("role" not in p for p in started_game.get_shared_state()["players"])
+
+        started_game.state = GameState.FINISHED
+
+        shared_state = started_game.get_shared_state()
+        assert all("role" in p for p in shared_state["players"])
+        assert shared_state["villager_word"] == started_game.villager_word
+
+    def test_unknown_player_gets_empty_state(self, started_game):
+        """Test that an unknown player ID yields an empty state."""
+        assert started_game.get_state_for_player("nobody") == {}
+
+    def test_state_message_matches_player_state(self, started_game):
+        """Test that the serialized message wraps the player's state."""
+        player = next(iter(started_game.players.values()))
+
+        message = json.loads(started_game.get_state_message(player.id))
+
+        assert message == {
+            "type": "state_update",
+            "data": started_game.get_state_for_player(player.id),
+        }
+        assert json.loads(started_game.get_state_message("nobody"))["data"] == {}
+
+
+class TestBroadcastState:
+    """Tests for broadcasting state to connected players."""
+
+    async def test_broadcast_sends_personal_state(self, started_game):
+        """Test that each connected player receives their own state."""
+        players = list(started_game.players.values())
+        sockets = {p.id: FakeWebSocket() for p in players}
+        started_game.connections.update(sockets)
+
+        await started_game.broadcast_state()
+
+        for player_id, websocket in sockets.items():
+            assert len(websocket.sent) == 1
+            message = json.loads(websocket.sent[0])
+            assert message["type"] == "state_update"
+            assert message["data"] == started_game.get_state_for_player(player_id)
+
+    async def test_broadcast_removes_failed_connections(self, started_game):
+        """Test that connections which fail to send are dropped."""
+        healthy, broken = list(started_game.players.values())[:2]
+        started_game.connections[healthy.id] = FakeWebSocket()
+        started_game.connections[broken.id] = FakeWebSocket(fail=True)
+
+        await started_game.broadcast_state()
+
+        assert healthy.id in started_game.connections
+        assert broken.id not in started_game.connections
+
+    async def test_slow_connection_does_not_delay_others(self, started_game):
+        """Test that sends run concurrently rather than one after another."""
+        players = list(started_game.players.values())
+        sockets = [FakeWebSocket(delay=0.05) for _ in players]
+        started_game.connections.update({p.id: ws for p, ws in zip(players, sockets, strict=True)})
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await started_game.broadcast_state()
+        elapsed = loop.time() - start
+
+        assert all(len(ws.sent) == 1 for ws in sockets)
+        assert elapsed < 0.05 * len(sockets)
+
+    async def test_failed_send_keeps_reconnected_socket(self, started_game):
+        """Test that a socket replaced during the broadcast is not removed."""
+        player = next(iter(started_game.players.values()))
+        started_game.connections[player.id] = FakeWebSocket(fail=True, delay=0.01)
+
+        broadcast = asyncio.create_task(started_game.broadcast_state())
+        await asyncio.sleep(0)
+        reconnected = FakeWebSocket()
+        started_game.connections[player.id] = reconnected
+        await broadcast
+
+        assert started_game.connections[player.id] is reconnected
+
+    def test_closing_old_socket_keeps_reconnected_socket(self):
+        """Test that an old socket closing after a reconnect doesn't unregister the new one."""
+        from app import app
+        from core.game_manager import game_manager
+        from middleware.rate_limiter import _rate_limiter
+
+        # Earlier tests may have used up the game-creation rate limit
+        _rate_limiter.requests.clear()
+        app.state.secret_key = secrets.token_hex(32)
+        client = TestClient(app)
+        game_id = client.post("/api/games/create").json()["game_id"]
+        join_response = client.post(f"/api/games/{game_id}/join", data={"nickname": "Alice"})
+        player_id = join_response.json()["player_id"]
+        game = game_manager.get_game(game_id)
+        assert game is not None
+
+        with ExitStack() as old_connection:
+            old_socket = old_connection.enter_context(
+                client.websocket_connect(f"/ws/{game_id}/{player_id}")
+            )
+            old_socket.receive_bytes()
+
+            with client.websocket_connect(f"/ws/{game_id}/{player_id}") as new_socket:
+                new_socket.receive_bytes()
+                old_connection.close()  # Old page's socket closes after the new one connects
+
+                assert player_id in game.connections
+
+    async def test_broadcast_serializes_players_once(self, started_game, monkeypatch):
+        """Test that the players list is built once per broadcast, not once per recipient."""
+        for player_id in started_game.players:
+            started_game.connections[player_id] = FakeWebSocket()
+
+        calls = 0
+        original_to_dict = Player.to_dict
+
+        def counting_to_dict(self, include_role: bool = False) -> dict:
+            nonlocal calls
+            calls += 1
+            return original_to_dict(self, include_role)
+
+        monkeypatch.setattr(Player, "to_dict", counting_to_dict)
+
+        await started_game.broadcast_state()
+
+        assert calls == len(started_game.players)
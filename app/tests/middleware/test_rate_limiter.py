@@ -6,6 +6,13 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app import app
+from middleware.rate_limiter import RateLimiter
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Share one test client across the module (limiter state is reset per test)."""
+    return TestClient(app)
 
 
 @pytest.fixture(autouse=True)
@@ -15,17 +22,16 @@ def reset_rate_limiter():
     from middleware.rate_limiter import _rate_limiter
 
     _rate_limiter.requests.clear()
-    _rate_limiter.last_cleanup = time.time()
+    _rate_limiter.last_cleanup = time.monotonic()
+    _rate_limiter._cleanup_cursor = None
     yield
 
 
 class TestRateLimiter:
     """Test rate limiting middleware behavior."""
 
-    def test_api_endpoint_rate_limit_enforced(self):
+    def test_api_endpoint_rate_limit_enforced(self, client):
         """Test that health endpoint is rate limited at 10 req/s."""
-        client = TestClient(app)
-
         # Make 10 requests (should all succeed - health limit is 10)
         for _ in range(10):
             response = client.get("/health")
@@ -35,11 +41,13 @@ class TestRateLimiter:
         response = client.get("/health")
         assert response.status_code == 429
         assert "rate limit" in response.json()["detail"].lower()
+        assert response.headers["retry-after"] == "1"
+        assert response.headers["x-ratelimit-limit"] == "10"
+        assert response.headers["x-ratelimit-remaining"] == "0"
+        assert response.headers["x-ratelimit-reset"] == "1"
 
-    def test_timer_endpoint_has_high_limit(self):
+    def test_timer_endpoint_has_high_limit(self, client):
         """Test that timer endpoint allows more requests than standard API endpoints."""
-        client = TestClient(app)
-
         # Timer endpoint has 30 req/s limit (vs 20 for regular API)
         # Make enough requests to exceed standard API limit
         success_count = 0
@@ -54,10 +62,8 @@ class TestRateLimiter:
         # Should allow more than the 20 req/s API limit, confirming higher timer limit
         assert success_count > 20, f"Only {success_count} requests succeeded, expected more than 20"
 
-    def test_static_files_exempt_from_rate_limiting(self):
+    def test_static_files_exempt_from_rate_limiting(self, client):
         """Test that static files are not rate limited."""
-        client = TestClient(app)
-
         # Make 10 requests to static files (more than normal API limit)
         for _ in range(10):
             # Request will 404 since file doesn't exist, but shouldn't be rate limited
@@ -65,10 +71,8 @@ class TestRateLimiter:
             # Should get 404 (not found) not 429 (rate limited)
             assert response.status_code == 404
 
-    def test_websocket_exempt_from_rate_limiting(self):
+    def test_websocket_exempt_from_rate_limiting(self, client):
         """Test that WebSocket endpoints are not rate limited."""
-        client = TestClient(app)
-
         # WebSocket endpoints should not be rate limited
         # We'll test by making multiple requests to websocket path
         for _ in range(10):
@@ -82,10 +86,8 @@ class TestRateLimiter:
                 # no rate limiting happens
                 pass
 
-    def test_rate_limit_resets_after_time_window(self):
+    def test_rate_limit_resets_after_time_window(self, client):
         """Test that rate limits reset after the time window passes."""
-        client = TestClient(app)
-
         # Hit the rate limit (health endpoint has 10 req/s limit)
         for _ in range(10):
             response = client.get("/health")
@@ -101,3 +103,49 @@ class TestRateLimiter:
         # Should be able to make requests again
         response = client.get("/health")
         assert response.status_code == 200
+
+
+class TestSlidingWindow:
+    """Test the RateLimiter sliding window directly."""
+
+    def test_expired_timestamps_are_dropped(self):
+        """Test that timestamps outside the window are evicted on the next check."""
+        limiter = RateLimiter()
+
+        assert limiter.is_allowed("1.2.3.4", limit=2, window=0.05)[:2] == (True, 1)
+        assert limiter.is_allowed("1.2.3.4", limit=2, window=0.05)[:2] == (True, 0)
+        allowed, remaining, reset_ms = limiter.is_allowed("1.2.3.4", limit=2, window=0.05)
+        assert (allowed, remaining) == (False, 0)
+        assert 0 < reset_ms <= 50
+
+        time.sleep(0.06)
+
+        assert limiter.is_allowed("1.2.3.4", limit=2, window=0.05)[0]
+        assert len(limiter.requests["1.2.3.4"]) == 1
+
+    def test_rejected_requests_are_not_recorded(self):
+        """Test that per-IP history stays bounded by the limit under a flood."""
+        limiter = RateLimiter()
+
+        results = [limiter.is_allowed("1.2.3.4", limit=5)[0] for _ in range(1000)]
+
+        assert results.count(True) == 5
+        assert len(limiter.requests["1.2.3.4"]) == 5
+
+    def test_cleanup_sweeps_in_batches(self):
+        """Test that stale IPs are removed over several batched cleanup calls."""
+        limiter = RateLimiter()
+        limiter.cleanup_batch_size = 2
+        stale = time.monotonic() - 120
+        for i in range(5):
+            limiter.requests[f"10.0.0.{i}"].append(stale)
+        limiter.is_allowed("1.2.3.4", limit=5)
+        limiter.last_cleanup = stale
+
+        limiter.cleanup_old_entries()
+        assert len(limiter.requests) == 4  # First batch of 2 examined
+
+        for _ in range(3):
+            limiter.cleanup_old_entries()
+        assert list(limiter.requests) == ["1.2.3.4"]
+        assert limiter._cleanup_cursor is None
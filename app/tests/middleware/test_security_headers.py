@@ -0,0 +1,28 @@
+"""Tests for security headers middleware."""
+
+from fastapi.testclient import TestClient
+
+from app import app
+
+
+class TestSecurityHeaders:
+    """Test security headers added to HTTP responses."""
+
+    def test_security_headers_present(self):
+        """Test that security headers are added to responses."""
+        client = TestClient(app)
+
+        response = client.get("/static/test.css")
+
+        assert response.headers["x-frame-options"] == "DENY"
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert "frame-ancestors 'none'" in response.headers["content-security-policy"]
+        assert "strict-transport-security" not in response.headers
+
+    def test_hsts_only_over_https(self):
+        """Test that HSTS is only sent for HTTPS requests."""
+        client = TestClient(app, base_url="https://testserver")
+
+        response = client.get("/static/test.css")
+
+        assert response.headers["strict-transport-security"].startswith("max-age=")
@@ -1,5 +1,6 @@
 """Tests for game state service."""
 
+from core.constants import MIN_PLAYERS
 from core.game_session import GameState
 from services.game_state import (
     can_start_game,
@@ -28,7 +29,7 @@ class TestCanStartGame:
 
         can_start, error = can_start_game(game_session)
         assert can_start is False
-        assert "Need at least" in error
+        assert error == f"Need at least {MIN_PLAYERS} players to start"
 
     def test_cannot_start_already_started_game(self, started_game):
         """Test that already started game cannot be started again."""
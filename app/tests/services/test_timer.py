@@ -1,6 +1,6 @@
 """Tests for voting timer functionality."""
 
-from datetime import datetime, timedelta
+import time
 
 import pytest
 
@@ -38,7 +38,7 @@ class TestVotingTimer:
     def test_get_voting_time_remaining(self, voting_game):
         """Test timestamp-based timer calculation."""
         voting_game.voting_timer_seconds = 60
-        voting_game.voting_started_at = datetime.now()
+        voting_game.voting_started_at = time.monotonic()
 
         # Should have close to 60 seconds remaining
         remaining = voting_game.get_voting_time_remaining()
@@ -48,7 +48,7 @@ class TestVotingTimer:
     def test_get_voting_time_remaining_expired(self, voting_game):
         """Test that expired timer returns 0."""
         voting_game.voting_timer_seconds = 60
-        voting_game.voting_started_at = datetime.now() - timedelta(seconds=65)
+        voting_game.voting_started_at = time.monotonic() - 65
 
         remaining = voting_game.get_voting_time_remaining()
         assert remaining == 0
@@ -0,0 +1,25 @@
+"""Tests for application wiring."""
+
+from collections import Counter
+
+from app import app
+
+
+class TestAppWiring:
+    """Test that the application is assembled exactly once."""
+
+    def test_routes_registered_once(self):
+        """Test that no route is registered more than once."""
+        registrations = Counter(
+            (getattr(route, "path", None), frozenset(getattr(route, "methods", None) or ()))
+            for route in app.routes
+        )
+
+        duplicates = [key for key, count in registrations.items() if count > 1]
+        assert duplicates == []
+
+    def test_middleware_registered_once(self):
+        """Test that each middleware is added only once."""
+        middleware_classes = Counter(m.cls for m in app.user_middleware)
+
+        assert all(count == 1 for count in middleware_classes.values())